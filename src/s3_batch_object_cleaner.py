@@ -1,9 +1,19 @@
 #!/usr/bin/env python3
 
 import boto3
+import csv
+import gzip
+import io
+import json
 import logging
+import queue
+import re
+import threading
+from operator import itemgetter
 from concurrent.futures import ThreadPoolExecutor
+from botocore.client import Config
 from botocore.exceptions import ClientError
+from urllib.parse import unquote_plus
 import argparse
 
 # Set up logging
@@ -15,8 +25,11 @@ logger = logging.getLogger()
 
 
 PROFILE_NAME = "mochi-admin"  # AWS profile to use
-MAX_CONCURRENCY = 8  # Maximum concurrent bucket operations
 MAX_KEYS = 1000  # Maximum keys per API call
+LIST_WORKERS = 16  # Concurrent prefix listings per bucket
+DELETE_WORKERS = 32  # Concurrent delete_objects calls per bucket
+DELETE_QUEUE_SIZE = 64  # Maximum pages of keys waiting to be deleted per bucket
+DELETE_BATCH_TIMEOUT = 0.5  # Seconds to wait for more keys before flushing a partial batch
 DRY_RUN = False  # Set to True for simulation, False for actual deletion
 
 # List of buckets to process
@@ -34,107 +47,499 @@ BUCKETS = [
     "mochi-prod-raw-historical-data"
 ]
 
+MAX_CONCURRENCY = min(len(BUCKETS), 16)  # Maximum concurrent bucket operations
 
-def delete_objects_from_bucket(bucket_name, symbol, profile_name, max_keys, dry_run, all_symbols=False):
+# Buckets that store a symbol's objects under a known prefix. These are listed server-side with that
+# prefix instead of scanning the whole bucket; buckets not listed here are scanned and filtered client-side.
+BUCKET_PREFIX_TEMPLATES = {
+    "mochi-prod-raw-historical-data": "stocks/{symbol}/",
+    "mochi-prod-aggregated-trades": "{symbol}/",
+}
+
+# Leading characters, in S3 key order, used to split a flat keyspace with no prefixes into key ranges
+SHARD_CHARACTERS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+# Inventory reports are written under a timestamped folder, e.g. 2025-04-01T01-00Z/
+INVENTORY_REPORT_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}-\d{2}Z/$')
+
+
+def _list_shard(s3, bucket_name, prefix, max_keys, operation='list_objects_v2', delimiter=None):
     """
-    Delete all objects containing the specified symbol from a bucket, or all objects if all_symbols is True
+    Yield list_objects_v2 (or list_object_versions) pages for every object under the given prefix.
+    With a delimiter only one level is listed, and the prefixes below it are returned as CommonPrefixes
     """
-    # Create a boto3 session with the given profile
-    session = boto3.Session(profile_name=profile_name)
-    s3 = session.client('s3')
+    paginator = s3.get_paginator(operation)
+    params = {'Bucket': bucket_name, 'Prefix': prefix, 'MaxKeys': max_keys}
+    if delimiter:
+        params['Delimiter'] = delimiter
+    yield from paginator.paginate(**params)
 
-    logger.info(f"Processing bucket: {bucket_name}")
 
-    # Use pagination to handle large numbers of objects
-    paginator = s3.get_paginator('list_objects_v2')
+def _list_key_range(s3, bucket_name, prefix, start_after, last_key, max_keys, operation='list_objects_v2'):
+    """
+    Yield list_objects_v2 (or list_object_versions) pages for the objects under the given prefix whose keys sort
+    after start_after, up to and including last_key. Either bound may be None
+    """
+    paginator = s3.get_paginator(operation)
+    params = {'Bucket': bucket_name, 'Prefix': prefix, 'MaxKeys': max_keys}
+    if start_after:
+        params['StartAfter' if operation == 'list_objects_v2' else 'KeyMarker'] = start_after
+
+    for page in paginator.paginate(**params):
+        in_range = {
+            field: [obj for obj in page[field]
+                    if (start_after is None or obj['Key'] > start_after)
+                    and (last_key is None or obj['Key'] <= last_key)]
+            for field in ('Contents', 'Versions', 'DeleteMarkers') if field in page
+        }
+        yield in_range
+
+        # Keys are returned in order, so once any fall past the end of the range the rest will too
+        if last_key is not None and any(obj['Key'] > last_key for field in in_range for obj in page[field]):
+            return
 
-    total_deleted = 0
-    total_found = 0
 
+def _latest_inventory_manifest(s3, bucket_name):
+    """
+    Find and read the newest CSV S3 Inventory manifest covering the whole bucket.
+    Returns (inventory_bucket, manifest_key, manifest), or None if no usable inventory can be read
+    """
     try:
-        # Iterate through pages of objects
-        for page in paginator.paginate(Bucket=bucket_name, MaxKeys=max_keys):
-            if 'Contents' not in page:
-                logger.info(f"No objects found in bucket {bucket_name}")
+        response = s3.list_bucket_inventory_configurations(Bucket=bucket_name)
+    except ClientError as e:
+        logger.warning(f"Unable to read inventory configuration for {bucket_name}: {e}")
+        return None
+
+    paginator = s3.get_paginator('list_objects_v2')
+    for config in response.get('InventoryConfigurationList', []):
+        destination = config['Destination']['S3BucketDestination']
+        # Filtered inventories only cover part of the bucket
+        if not config['IsEnabled'] or 'Filter' in config or destination['Format'] != 'CSV':
+            continue
+
+        inventory_bucket = destination['Bucket'].split(':::')[-1]
+        parts = [destination.get('Prefix', '').strip('/'), bucket_name, config['Id']]
+        report_prefix = '/'.join(part for part in parts if part) + '/'
+
+        # Inventory destinations are often in another account, so reading them may be denied
+        try:
+            reports = [
+                common_prefix['Prefix']
+                for page in paginator.paginate(Bucket=inventory_bucket, Prefix=report_prefix, Delimiter='/')
+                for common_prefix in page.get('CommonPrefixes', [])
+                if INVENTORY_REPORT_PATTERN.match(common_prefix['Prefix'][len(report_prefix):])
+            ]
+            if not reports:
                 continue
 
-            # Filter for objects containing the symbol or all objects
-            objects_to_delete = []
-            for obj in page['Contents']:
-                key = obj['Key']
-                if all_symbols or (symbol and symbol in key):
-                    objects_to_delete.append({'Key': key})
-                    total_found += 1
-                    logger.debug(f"Found matching object: {key}")
-
-            # If no matching objects in this page, continue to next page
-            if not objects_to_delete:
+            manifest_key = max(reports) + 'manifest.json'
+            manifest = json.load(s3.get_object(Bucket=inventory_bucket, Key=manifest_key)['Body'])
+        except ClientError as e:
+            logger.warning(f"Unable to read inventory {config['Id']} for {bucket_name} "
+                           f"from s3://{inventory_bucket}/{report_prefix}: {e}")
+            continue
+
+        return inventory_bucket, manifest_key, manifest
+
+    return None
+
+
+def _list_inventory_file(s3, inventory_bucket, data_key, columns, max_keys):
+    """
+    Yield list_objects_v2-shaped pages for the keys recorded in one gzipped inventory CSV file
+    """
+    key_index = columns.index('Key')
+    # Inventories that include all versions also list noncurrent versions of each key
+    latest_index = columns.index('IsLatest') if 'IsLatest' in columns else None
+
+    body = s3.get_object(Bucket=inventory_bucket, Key=data_key)['Body']
+    with gzip.open(body, 'rt', newline='') as data_file:
+        contents = []
+        for row in csv.reader(data_file):
+            if latest_index is not None and row[latest_index] != 'true':
                 continue
+            # Keys in inventory reports are URL-encoded
+            contents.append({'Key': unquote_plus(row[key_index])})
+            if len(contents) == max_keys:
+                yield {'Contents': contents}
+                contents = []
+
+        if contents:
+            yield {'Contents': contents}
 
-            logger.info(f"Found {len(objects_to_delete)} objects "
-                        f"{'in total' if all_symbols else f'containing {symbol}'} in {bucket_name}")
-
-            # Delete the objects if not in dry run mode
-            if not dry_run and objects_to_delete:
-                for i in range(0, len(objects_to_delete), 1000):
-                    batch = objects_to_delete[i:i + 1000]
-                    response = s3.delete_objects(
-                        Bucket=bucket_name,
-                        Delete={'Objects': batch}
-                    )
-                    deleted_count = len(response.get('Deleted', []))
-                    total_deleted += deleted_count
-
-                    if 'Errors' in response:
-                        for error in response['Errors']:
-                            logger.error(
-                                f"Error deleting {error['Key']}: {error['Code']} - {error['Message']}"
-                            )
-
-                logger.info(f"Deleted {len(objects_to_delete)} objects from {bucket_name}")
-            elif dry_run:
-                logger.info(f"[DRY RUN] Would delete {len(objects_to_delete)} objects from {bucket_name}")
+
+def _count_inventory_file(s3, inventory_bucket, data_key, columns, symbol=None):
+    """
+    Count the keys in one gzipped inventory CSV file containing symbol (or all keys if symbol is None)
+    with S3 Select, so only candidate keys (or just the count) are transferred rather than the whole file
+    """
+    key_column = f"s._{columns.index('Key') + 1}"
+    conditions = []
+    if 'IsLatest' in columns:
+        conditions.append(f"s._{columns.index('IsLatest') + 1} = 'true'")
+
+    if symbol:
+        # Keys in inventory reports are URL-encoded, so LIKE is only a pre-filter and the match is
+        # made on the decoded key. An alphanumeric symbol is never encoded, so any key containing it
+        # contains it in encoded form too; other symbols can't be pre-filtered reliably.
+        if symbol.isalnum() and symbol.isascii():
+            conditions.append(f"{key_column} LIKE '%{symbol}%'")
+        expression = f"SELECT {key_column} FROM S3Object s"
+    else:
+        expression = "SELECT COUNT(*) FROM S3Object s"
+    if conditions:
+        expression += " WHERE " + " AND ".join(conditions)
+
+    response = s3.select_object_content(
+        Bucket=inventory_bucket,
+        Key=data_key,
+        ExpressionType='SQL',
+        Expression=expression,
+        InputSerialization={'CSV': {'FileHeaderInfo': 'NONE'}, 'CompressionType': 'GZIP'},
+        OutputSerialization={'CSV': {}}
+    )
+    records = b''.join(event['Records']['Payload'] for event in response['Payload'] if 'Records' in event)
+
+    if not symbol:
+        return int(records.decode().strip() or 0)
+    return sum(1 for row in csv.reader(io.StringIO(records.decode())) if row and symbol in unquote_plus(row[0]))
+
+
+def create_s3_client(session):
+    """
+    Create the S3 client for one bucket from the shared session. A single client shared by every bucket would need a
+    connection pool per virtual-hosted bucket endpoint, more than urllib3's default of 10, and would keep evicting and
+    closing them. The pool is sized for the bucket's top-level listing plus its list and delete workers
+    """
+    return session.client('s3', config=Config(
+        max_pool_connections=LIST_WORKERS + DELETE_WORKERS + 1,
+        retries={'mode': 'adaptive', 'max_attempts': 10},
+        tcp_keepalive=True
+    ))
+
+
+def delete_objects_from_bucket(s3, bucket_name, symbol, max_keys, dry_run, all_symbols=False,
+                               use_inventory=False):
+    """
+    Delete all objects containing the specified symbol from a bucket, or all objects if all_symbols is True.
+    With use_inventory the keys are read from the bucket's latest S3 Inventory report instead of being listed.
+    Returns (found, deleted, versioned); for versioned buckets the counts are object versions and delete markers
+    """
+    logger.info(f"Processing bucket: {bucket_name}")
+
+    prefix = ''
+    if symbol and not all_symbols and bucket_name in BUCKET_PREFIX_TEMPLATES:
+        prefix = BUCKET_PREFIX_TEMPLATES[bucket_name].format(symbol=symbol)
+        logger.info(f"Listing {bucket_name} under prefix {prefix}")
+
+    try:
+        versioning = s3.get_bucket_versioning(Bucket=bucket_name).get('Status')
+    except ClientError as e:
+        logger.warning(f"Unable to read versioning status for {bucket_name}, treating it as unversioned: {e}")
+        versioning = None
+
+    # Suspended buckets still hold the versions written while versioning was enabled
+    versioned = versioning in ('Enabled', 'Suspended')
+    list_operation = 'list_object_versions' if versioned else 'list_objects_v2'
+    if versioned:
+        logger.info(f"Bucket {bucket_name} is versioned ({versioning}), deleting all object versions")
+    # Versioned buckets count versions and delete markers rather than objects, so they are reported separately
+    unit = 'object versions' if versioned else 'objects'
+
+    totals = {'found': 0, 'deleted': 0}
+    lock = threading.Lock()
+    errors = []
+
+    # Listing threads push matching keys onto a bounded queue and delete threads
+    # drain it, so deletes start with the first page and the full listing is
+    # never held in memory.
+    delete_queue = queue.Queue(maxsize=DELETE_QUEUE_SIZE)
+    delete_threads = []
+
+    # Listing shards run on their own pool; shards can add further shards while running
+    list_executor = ThreadPoolExecutor(max_workers=LIST_WORKERS)
+    list_futures = []
+
+    get_key = itemgetter('Key')
+    get_key_and_version = itemgetter('Key', 'VersionId')
+    match_description = 'in total' if all_symbols else f'containing {symbol}'
+
+    def handle_page(page):
+        # Versioned buckets delete every version and delete marker, otherwise the data stays behind
+        if versioned:
+            objects = page.get('Versions', []) + page.get('DeleteMarkers', [])
+        else:
+            objects = page.get('Contents', [])
+
+        # Filter for objects containing the symbol or all objects
+        if not all_symbols and not symbol:
+            objects = []
+
+        if versioned:
+            objects_to_delete = [{'Key': key, 'VersionId': version_id}
+                                 for key, version_id in map(get_key_and_version, objects)
+                                 if all_symbols or symbol in key]
+        else:
+            objects_to_delete = [{'Key': key} for key in map(get_key, objects) if all_symbols or symbol in key]
+
+        # Logging here runs per page and per key, so it uses %-style arguments and nothing is formatted unless emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            for obj in objects_to_delete:
+                logger.debug("Found matching object: %s", obj['Key'])
+
+        # If no matching objects in this page, continue to next page
+        if not objects_to_delete:
+            return
+
+        with lock:
+            totals['found'] += len(objects_to_delete)
+
+        logger.info("Found %d %s %s in %s", len(objects_to_delete), unit, match_description, bucket_name)
+
+        # Hand the keys to the delete threads if not in dry run mode
+        if not dry_run:
+            start_delete_thread()
+            delete_queue.put(objects_to_delete)
+        else:
+            logger.info("[DRY RUN] Would delete %d %s from %s", len(objects_to_delete), unit, bucket_name)
+
+    def list_shard(prefix, split):
+        # While there are fewer shards than list workers, list one level of the prefix and hand each
+        # prefix below it to its own shard. Otherwise walk everything under the prefix.
+        delimiter = '/' if split else None
+        for page_number, page in enumerate(_list_shard(s3, bucket_name, prefix, max_keys, list_operation, delimiter)):
+            # Stop listing as soon as a delete has failed; the error is raised once the shards finish
+            if errors:
+                return
+
+            # A full first page with no prefixes below it is a flat keyspace, which can't be split by
+            # delimiter. While shards are still short, split it into key ranges by leading character
+            # instead; the ranges re-list this page.
+            if (split and page_number == 0 and page.get('IsTruncated') and not page.get('CommonPrefixes')
+                    and len(list_futures) < LIST_WORKERS):
+                boundaries = [None] + [prefix + char for char in SHARD_CHARACTERS] + [None]
+                for start_after, last_key in zip(boundaries, boundaries[1:]):
+                    submit_listing(list_key_range, prefix, start_after, last_key)
+                return
+
+            handle_page(page)
+            for common_prefix in page.get('CommonPrefixes', []):
+                submit_shard(common_prefix['Prefix'])
+
+    def list_key_range(prefix, start_after, last_key):
+        for page in _list_key_range(s3, bucket_name, prefix, start_after, last_key, max_keys, list_operation):
+            if errors:
+                return
+            handle_page(page)
+
+    def run_listing(listing, *args):
+        # Record a listing failure straight away so every other shard stops at its next page
+        if errors:
+            return
+        try:
+            listing(*args)
+        except Exception as e:
+            with lock:
+                errors.append(e)
+            raise
+
+    def submit_listing(listing, *args):
+        with lock:
+            # Checked under the lock so no shard is submitted after a failure has shut the pool down
+            if errors:
+                return
+            list_futures.append(list_executor.submit(run_listing, listing, *args))
+
+    def submit_shard(prefix):
+        # Shards keep splitting until there is one for every list worker
+        submit_listing(list_shard, prefix, len(list_futures) < LIST_WORKERS)
+
+    def list_inventory_file(inventory_bucket, data_key, columns):
+        for page in _list_inventory_file(s3, inventory_bucket, data_key, columns, max_keys):
+            if errors:
+                return
+            handle_page(page)
+
+    def count_inventory_file(inventory_bucket, data_key, columns):
+        # Without a symbol only --all-symbols runs match anything
+        if not all_symbols and not symbol:
+            return
+
+        try:
+            count = _count_inventory_file(s3, inventory_bucket, data_key, columns, None if all_symbols else symbol)
+        except ClientError as e:
+            logger.warning("S3 Select failed for s3://%s/%s (%s), reading the inventory file instead",
+                           inventory_bucket, data_key, e)
+            list_inventory_file(inventory_bucket, data_key, columns)
+            return
+
+        with lock:
+            totals['found'] += count
+        logger.info("[DRY RUN] Would delete %d objects %s from %s", count, match_description, bucket_name)
+
+    def delete_batch(batch):
+        response = s3.delete_objects(
+            Bucket=bucket_name,
+            Delete={'Objects': batch}
+        )
+        with lock:
+            totals['deleted'] += len(response.get('Deleted', []))
+
+        if 'Errors' in response:
+            for error in response['Errors']:
+                logger.error("Error deleting %s: %s - %s", error['Key'], error['Code'], error['Message'])
+
+    def start_delete_thread():
+        # Delete threads are started on demand: one with the first batch, then another each time
+        # batches back up. Buckets with few or no matches don't pay for a full set of idle threads.
+        with lock:
+            if len(delete_threads) < DELETE_WORKERS and (not delete_threads or not delete_queue.empty()):
+                thread = threading.Thread(target=delete_worker, daemon=True)
+                thread.start()
+                delete_threads.append(thread)
+
+    def delete_worker():
+        # Accumulate keys into full 1000-key batches, flushing early when the
+        # listing goes quiet so sparse matches don't wait for the end of the scan
+        batch = []
+
+        def flush(objects):
+            # After a failure keep consuming the queue without deleting, so the
+            # listing threads never block on a full queue
+            if objects and not errors:
+                try:
+                    delete_batch(objects)
+                except Exception as e:
+                    errors.append(e)
+
+        while True:
+            try:
+                objects = delete_queue.get(timeout=DELETE_BATCH_TIMEOUT)
+            except queue.Empty:
+                flush(batch)
+                batch = []
+                continue
+
+            if objects is None:
+                break
+
+            batch.extend(objects)
+            while len(batch) >= 1000:
+                flush(batch[:1000])
+                batch = batch[1000:]
+
+        flush(batch)
+
+    try:
+        try:
+            # A prefix listing already returns only matching keys, and inventory reports only give
+            # current versions, so the inventory is only used for unprefixed, unversioned buckets
+            inventory = None
+            if use_inventory and not prefix and not versioned:
+                inventory = _latest_inventory_manifest(s3, bucket_name)
+
+            with list_executor:
+                try:
+                    if inventory:
+                        # Read the keys from the inventory report, one shard per data file
+                        inventory_bucket, manifest_key, manifest = inventory
+                        logger.info(f"Reading keys for {bucket_name} from inventory s3://{inventory_bucket}/{manifest_key}")
+                        columns = [column.strip() for column in manifest['fileSchema'].split(',')]
+                        # A dry run only needs a count, which S3 Select can compute without downloading the keys
+                        read_inventory_file = count_inventory_file if dry_run else list_inventory_file
+                        for data_file in manifest['files']:
+                            submit_listing(read_inventory_file, inventory_bucket, data_file['key'], columns)
+                    else:
+                        if use_inventory and not prefix and not versioned:
+                            logger.info(f"No usable inventory for {bucket_name}, listing objects instead")
+
+                        # List the top level of the bucket (or symbol prefix) here. Each prefix below it becomes a
+                        # shard, and shards keep splitting into their sub-prefixes until every list worker has one.
+                        list_shard(prefix, split=True)
+
+                    # Shards are only added by running shards, so once every future in the list has
+                    # finished no more can appear
+                    index = 0
+                    while index < len(list_futures):
+                        list_futures[index].result()
+                        index += 1
+                except Exception as e:
+                    # Stop the running shards at their next page, and cancel the queued ones, so a failed
+                    # listing doesn't carry on deleting the rest of the bucket
+                    with lock:
+                        errors.append(e)
+                    list_executor.shutdown(cancel_futures=True)
+                    raise
+        finally:
+            # Signal end-of-stream to every delete thread and wait for them to finish
+            for _ in delete_threads:
+                delete_queue.put(None)
+            for thread in delete_threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+
+        if totals['found'] == 0:
+            logger.info(f"No {unit} found in bucket {bucket_name}")
+        elif not dry_run:
+            logger.info(f"Deleted {totals['deleted']} {unit} from {bucket_name}")
 
     except ClientError as e:
         logger.error(f"Error processing bucket {bucket_name}: {e}")
-        return 0, 0
+        return 0, 0, versioned
 
-    return total_found, total_deleted
+    return totals['found'], totals['deleted'], versioned
 
-def process_all_buckets(symbol, profile_name, max_keys, dry_run, all_symbols=False):
+def process_all_buckets(symbol, profile_name, max_keys, dry_run, all_symbols=False, use_inventory=False):
     """
-    Process all buckets in parallel using ThreadPoolExecutor
+    Process all buckets in parallel using ThreadPoolExecutor.
+    Returns (objects found, objects deleted, versions found, versions deleted)
     """
     total_found = 0
     total_deleted = 0
+    total_versions_found = 0
+    total_versions_deleted = 0
+    # Resolve the profile and credential chain once. Clients are created here on the main thread
+    # because creating them from a session isn't thread-safe.
+    session = boto3.Session(profile_name=profile_name)
+    clients = {bucket: create_s3_client(session) for bucket in BUCKETS}
 
     with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as executor:
         futures = {
             executor.submit(
                 delete_objects_from_bucket,
+                clients[bucket],
                 bucket,
                 symbol,
-                profile_name,
                 max_keys,
                 dry_run,
-                all_symbols
+                all_symbols,
+                use_inventory
             ): bucket for bucket in BUCKETS
         }
 
         for future in futures:
             bucket = futures[future]
             try:
-                found, deleted = future.result()
-                total_found += found
-                total_deleted += deleted
+                found, deleted, versioned = future.result()
+                if versioned:
+                    total_versions_found += found
+                    total_versions_deleted += deleted
+                else:
+                    total_found += found
+                    total_deleted += deleted
             except Exception as e:
                 logger.error(f"Error processing bucket {bucket}: {e}")
 
-    return total_found, total_deleted
+    return total_found, total_deleted, total_versions_found, total_versions_deleted
 
 def main():
     parser = argparse.ArgumentParser(description="S3 Batch Object Cleaner")
     parser.add_argument('--all-symbols', action='store_true', help='Delete ALL objects in the buckets')
+    parser.add_argument('--use-inventory', action='store_true',
+                        help='Read keys from the latest S3 Inventory report instead of listing each bucket. '
+                             'Objects created since that report are not deleted')
     args = parser.parse_args()
 
     deleting_everything = args.all_symbols
@@ -161,14 +566,17 @@ def main():
     logger.info(f"Max concurrency: {MAX_CONCURRENCY}")
     logger.info(f"Max keys per request: {MAX_KEYS}")
 
-    total_found, total_deleted = process_all_buckets(symbol, PROFILE_NAME, MAX_KEYS, DRY_RUN, deleting_everything)
+    total_found, total_deleted, total_versions_found, total_versions_deleted = process_all_buckets(
+        symbol, PROFILE_NAME, MAX_KEYS, DRY_RUN, deleting_everything, args.use_inventory
+    )
 
     if DRY_RUN:
-        logger.info(f"DRY RUN SUMMARY: Found {total_found} objects " +
+        logger.info(f"DRY RUN SUMMARY: Found {total_found} objects and {total_versions_found} object versions " +
                     ("(ALL SYMBOLS)" if deleting_everything else f"containing '{SYMBOL}'") + " across all buckets")
     else:
         logger.info(
-            f"SUMMARY: Found {total_found} objects and deleted {total_deleted} objects " +
+            f"SUMMARY: Found {total_found} objects and deleted {total_deleted} objects, "
+            f"found {total_versions_found} object versions and deleted {total_versions_deleted} object versions " +
             ("(ALL SYMBOLS)" if deleting_everything else f"containing '{SYMBOL}'") + " across all buckets"
         )
 